@@ -1,9 +1,14 @@
 import os
 import re
-import copy
+import json
+import asyncio
+import hashlib
+import pathlib
 import log
 import utility
-from web3.auto import w3
+from concurrent.futures import ProcessPoolExecutor
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from eth_utils import keccak
 from fabric import Connection
 from eth_rpc_client import Client as RpcClient
 from invoke import Responder
@@ -21,6 +26,26 @@ DEPLOYMENT_DIR = '/home/{}/network-data'
 SYSTEMD_START_CLIENT = 'sudo systemctl start autonity.service'
 SYSTEMD_STOP_CLIENT = 'sudo systemctl stop autonity.service'
 
+SYSTEMD_SERVICE_TEMPLATE = "[Unit]\n" \
+    "Description=Clearmatics Autonity Client server\n" \
+    "After=syslog.target network.target\n" \
+    "[Service]\n" \
+    "Type=simple\n" \
+    "ExecStart={} --genesis {} --datadir {} --autonitykeys {} --syncmode 'full' --port {} --consensus.port {} " \
+    "--http.port {} --http --http.addr '0.0.0.0' --ws --ws.port {} --http.corsdomain '*' "\
+    "--http.api 'personal,debug,db,eth,net,web3,txpool,miner,tendermint,clique' --networkid 1991  " \
+    "--allow-insecure-unlock --graphql " \
+    "--unlock 0x{} --password {} " \
+    "--mine --miner.threads '1' --verbosity 4 --miner.gaslimit 10000000000 \n" \
+    "KillMode=process\n" \
+    "KillSignal=SIGINT\n" \
+    "TimeoutStopSec=1\n" \
+    "Restart=on-failure\n" \
+    "RestartSec=1s\n" \
+    "[Install]\n" \
+    "Alias=autonity.service\n"\
+    "WantedBy=multi-user.target"
+
 # use ip tables module of linux kernel which is common for all linux distributions to control peer connection.
 CONNECT_PEER = "sudo iptables -j DROP -D INPUT -s {}"
 IS_PEER_ALREADY_DISCONNECTED = "sudo iptables -j DROP -C INPUT -s {}"
@@ -57,6 +82,46 @@ DEFAULT_PACKAGE_DUPLICATE_RATE = 0.1  # 0.1%
 DEFAULT_PACKAGE_REORDER_RATE = 0.1  # 0.1%
 DEFAULT_PACKAGE_CORRUPT_RATE = 0.1  # 0.1%
 
+# compiled once; restricted to hex digits so malformed account-creation output
+# is rejected instead of silently accepted as an address.
+_ADDR_RE = re.compile(r'0x([0-9a-fA-F]{40})')
+
+# scrypt keystore decryption is CPU-bound, dispatch it to worker processes so
+# concurrent enode generations use all cores instead of serializing on the GIL.
+_keystore_decrypt_pool = None
+
+
+def _get_keystore_decrypt_pool():
+    global _keystore_decrypt_pool
+    if _keystore_decrypt_pool is None:
+        _keystore_decrypt_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _keystore_decrypt_pool
+
+
+def _decrypt_keystore(encrypted_key):
+    # decrypt the v3 keystore by hand: hashlib.scrypt and the cryptography AES
+    # cipher both run in OpenSSL, which is faster than the KDF backend web3
+    # selects for w3.eth.account.decrypt.
+    crypto = json.loads(encrypted_key)["crypto"]
+    kdfparams = crypto["kdfparams"]
+    password = b"123"
+    if crypto["kdf"] == "scrypt":
+        derived_key = hashlib.scrypt(password, salt=bytes.fromhex(kdfparams["salt"]), n=kdfparams["n"],
+                                     r=kdfparams["r"], p=kdfparams["p"], dklen=kdfparams["dklen"], maxmem=2 ** 30)
+    elif crypto["kdf"] == "pbkdf2":
+        derived_key = hashlib.pbkdf2_hmac("sha256", password, bytes.fromhex(kdfparams["salt"]),
+                                          kdfparams["c"], dklen=kdfparams["dklen"])
+    else:
+        raise ValueError("unsupported keystore kdf: {}".format(crypto["kdf"]))
+
+    ciphertext = bytes.fromhex(crypto["ciphertext"])
+    if keccak(derived_key[16:32] + ciphertext).hex() != crypto["mac"]:
+        raise ValueError("keystore MAC mismatch")
+
+    iv = bytes.fromhex(crypto["cipherparams"]["iv"])
+    decryptor = Cipher(algorithms.AES(derived_key[:16]), modes.CTR(iv)).decryptor()
+    return (decryptor.update(ciphertext) + decryptor.finalize()).hex()
+
 
 class Client(object):
     def __init__(self, host=None, p2p_port=None, acn_port=None, rpc_port=None, ws_port=None, net_interface=None,
@@ -92,42 +157,50 @@ class Client(object):
         work_dir = "{}/{}".format(data_dir, self.host)
         utility.create_dir(work_dir)
 
-    def generate_new_account(self):
+    async def generate_new_account(self):
         folder = self.host
-        utility.execute("echo 123 > ./network-data/{}/pass.txt".format(folder))
-        output = utility.execute(
-            '{} --datadir "./network-data/{}/data" --password "./network-data/{}/pass.txt" account new'
-            .format(self.autonity_path, folder, folder)
+        pathlib.Path("./network-data/{}/pass.txt".format(folder)).write_text("123\n")
+        output = await utility.execute_async(
+            [self.autonity_path, "--datadir", "./network-data/{}/data".format(folder),
+             "--password", "./network-data/{}/pass.txt".format(folder), "account", "new"],
+            capture=True
         )
         self.logger.debug(output)
-        m = re.findall(r'0x(.{40})', output[0], re.MULTILINE)
-        if len(m) == 0:
+        m = _ADDR_RE.search(output[0])
+        if m is None:
             self.logger.error("Aborting - account creation failed")
             return None
         else:
-            self.coin_base = m[0]
+            self.coin_base = m.group(1)
             return self.coin_base
 
-    def generate_enode(self):
+    async def generate_enode(self):
         folder = self.host
 
         keystores_dir = "./network-data/{}/data/keystore".format(folder)
-        keystore_file_path = keystores_dir + "/" + os.listdir(keystores_dir)[0]
+        # only the first (and only) keystore file is needed, no point building
+        # the full listing.
+        with os.scandir(keystores_dir) as entries:
+            keystore_file_path = next(entries).path
         with open(keystore_file_path) as keyfile:
             encrypted_key = keyfile.read()
-            account_private_key = w3.eth.account.decrypt(encrypted_key, "123").hex()[2:]
+        # get_event_loop rather than get_running_loop (3.7+): inside a
+        # coroutine it returns the running loop on python 3.6 as well.
+        account_private_key = await asyncio.get_event_loop().run_in_executor(
+            _get_keystore_decrypt_pool(), _decrypt_keystore, encrypted_key)
         with open("./network-data/{}/boot.key".format(folder), "w") as bootkey:
             bootkey.write(account_private_key)
 
-        pub_key = \
-            utility.execute("{} -writeaddress -nodekey ./network-data/{}/boot.key".
-                            format(self.bootnode_path, folder))[0].rstrip()
+        output = await utility.execute_async(
+            [self.bootnode_path, "-writeaddress", "-nodekey", "./network-data/{}/boot.key".format(folder)],
+            capture=True)
+        pub_key = output[0].rstrip()
         # new patern: "enode://pubKey:host:port?discPort=30303&acnep=host:port"
         self.e_node = "enode://{}@{}:{}?discPort={}&acnep={}:{}".format(pub_key, self.host, self.p2p_port, self.p2p_port, self.host, self.acn_port)
 
         # gen an autonity consensus key and append it in boot.key file for client.
         tmp_key_file = "./network-data/{}/tmp.key".format(folder)
-        _, _, consensus_pub_key, consensus_pri_key, _ = utility.gen_autonity_keys(self.autonity_path, self.key_inspector_path, tmp_key_file)
+        _, _, consensus_pub_key, consensus_pri_key, _ = await utility.gen_autonity_keys(self.autonity_path, self.key_inspector_path, tmp_key_file)
         self.consensus_pub_key = consensus_pub_key
         # append a tmp consensus key at boot.key
         with open("./network-data/{}/boot.key".format(folder), "a") as bootkey:
@@ -135,26 +208,6 @@ class Client(object):
         return self.e_node
 
     def generate_system_service_file(self):
-        template_remote = "[Unit]\n" \
-                   "Description=Clearmatics Autonity Client server\n" \
-                   "After=syslog.target network.target\n" \
-                   "[Service]\n" \
-                   "Type=simple\n" \
-                   "ExecStart={} --genesis {} --datadir {} --autonitykeys {} --syncmode 'full' --port {} --consensus.port {} " \
-                   "--http.port {} --http --http.addr '0.0.0.0' --ws --ws.port {} --http.corsdomain '*' "\
-                   "--http.api 'personal,debug,db,eth,net,web3,txpool,miner,tendermint,clique' --networkid 1991  " \
-                   "--allow-insecure-unlock --graphql " \
-                   "--unlock 0x{} --password {} " \
-                   "--mine --miner.threads '1' --verbosity 4 --miner.gaslimit 10000000000 \n" \
-                   "KillMode=process\n" \
-                   "KillSignal=SIGINT\n" \
-                   "TimeoutStopSec=1\n" \
-                   "Restart=on-failure\n" \
-                   "RestartSec=1s\n" \
-                   "[Install]\n" \
-                   "Alias=autonity.service\n"\
-                   "WantedBy=multi-user.target"
-
         folder = self.host
 
         print("prepare autonity systemd service file for node: %s", self.host)
@@ -169,15 +222,15 @@ class Client(object):
         coin_base = self.coin_base
         password_file = KEY_PASSPHRASE_FILE.format(self.ssh_user, folder)
 
-        content = template_remote.format(bin_path, genesis_path, data_dir, boot_key_file, p2p_port, acn_port, rpc_port, ws_port,
-                                         coin_base, password_file)
+        content = SYSTEMD_SERVICE_TEMPLATE.format(bin_path, genesis_path, data_dir, boot_key_file, p2p_port, acn_port,
+                                                  rpc_port, ws_port, coin_base, password_file)
         with open("./network-data/{}/autonity.service".format(folder), 'w') as out:
             out.write(content)
 
     def generate_package(self):
         folder = self.host
-        utility.execute('cp {} ./network-data/'.format(self.autonity_path))
-        utility.execute('tar -zcvf ./network-data/{}.tgz ./network-data/{}/ ./network-data/genesis.json ./network-data/autonity'.format(folder, folder))
+        utility.execute(["tar", "-zcvf", "./network-data/{}.tgz".format(folder), "./network-data/{}/".format(folder),
+                         "./network-data/genesis.json", "./network-data/autonity"])
 
     def deliver_package(self):
         try:
@@ -300,14 +353,14 @@ class Client(object):
             zip_file = "{}/{}.tgz".format(log_folder, self.host)
             log_file = "{}/{}.log".format(log_folder, self.host)
             # untar file,
-            utility.execute("tar -zxvf {} --directory {}".format(zip_file, log_folder))
+            utility.execute(["tar", "-zxvf", zip_file, "--directory", log_folder])
             # read file and print into log file.
             self.logger.info("\t\t\t **** node_%s logs started from here. **** \n\n\n", self.host)
             with open(log_file, "r", encoding="utf-8") as fp:
                 for _, line in enumerate(fp):
                     self.logger.info("NODE_%s_%s: %s", self.index, self.host, line.encode("utf-8"))
             # remove file.
-            utility.execute("rm -f {}".format(log_file))
+            utility.execute(["rm", "-f", log_file])
         except Exception as e:
             self.logger.error('Exception happens. %s', e)
 
@@ -670,7 +723,9 @@ class Client(object):
             if self.start_client() is not True:
                 failed = True
 
-        disconnected_peers = copy.deepcopy(self.disconnected_peers)
+        # shallow copy is enough, the entries are plain strings and we only
+        # mutate the original list while iterating this snapshot.
+        disconnected_peers = list(self.disconnected_peers)
         if len(disconnected_peers) > 0:
             for peer in disconnected_peers:
                 endpoint = peer.split(":")
@@ -1,3 +1,4 @@
+import os
 import yaml
 import log
 import ipaddress
@@ -7,6 +8,11 @@ LOGGER = log.get_logger()
 CONFIG_FILE = "./etc/e2e_test_conf.yml"
 CONF = None
 
+# test case conf is polled between test cases to honour the user stop flag,
+# cache the parsed document and only re-read the file when it changed.
+TEST_CASE_CONF = None
+TEST_CASE_CONF_MTIME = None
+
 
 def write_yaml(file, data):
     try:
@@ -39,10 +45,19 @@ def get_test_case_conf_file_name():
 
 
 def get_test_case_conf():
+    global TEST_CASE_CONF, TEST_CASE_CONF_MTIME
     file = get_test_case_conf_file_name()
     if file is None:
         return None
-    return load_conf(file)
+    try:
+        mtime = os.stat(file).st_mtime
+    except OSError as e:
+        LOGGER.error("Cannot stat conf file: %s, %s", file, e)
+        return None
+    if TEST_CASE_CONF is None or mtime != TEST_CASE_CONF_MTIME:
+        TEST_CASE_CONF = load_conf(file)
+        TEST_CASE_CONF_MTIME = mtime
+    return TEST_CASE_CONF
 
 
 def get_test_bed_conf():
@@ -107,8 +107,9 @@ if __name__ == '__main__':
         for case in failed_testcases:
             LG.info("[ERROR] %s", case["name"])
 
-        for i in range(0, len(failed_testcases)):
-            LG.info("Log collecting...")
-            time.sleep(180)
+        # one waiting window is enough for the log collector to pick up the
+        # system logs of all failed cases, no need to wait per case.
+        LG.info("Log collecting...")
+        time.sleep(180)
 
     exit(exit_code)
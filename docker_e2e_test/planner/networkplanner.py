@@ -1,5 +1,7 @@
+import asyncio
 import copy
-import json
+import orjson
+import pathlib
 import utility
 import log
 from client.client import Client
@@ -10,11 +12,9 @@ class NetworkPlanner(object):
     def __init__(self, autonity_path):
         self.logger = log.get_logger()
         self.autonity_path = autonity_path
-        path_list = autonity_path.split("/")
-        path_list[len(path_list) - 1] = "bootnode"
-        self.bootnode_path = "/".join(path_list)
-        path_list[len(path_list) - 1] = "ethkey"
-        self.key_inspector_path = "/".join(path_list)
+        # bootnode and ethkey live next to the autonity binary.
+        self.bootnode_path = str(pathlib.Path(autonity_path).with_name("bootnode"))
+        self.key_inspector_path = str(pathlib.Path(autonity_path).with_name("ethkey"))
         self.validator_ip_list = []
         self.participant_ip_list = []
         self.clients = []
@@ -56,11 +56,16 @@ class NetworkPlanner(object):
 
     def generate_accounts(self):
         self.logger.info("===== ACCOUNTS CREATION =====")
-        accounts = []
-        for client in self.clients:
-            account = client.generate_new_account()
-            if account:
-                accounts.append(account)
+
+        # account creations are independent across nodes, fan them out so the
+        # per-node fork/exec latencies overlap instead of accumulating.
+        async def create_all():
+            return await asyncio.gather(*[client.generate_new_account() for client in self.clients])
+
+        # run_until_complete rather than asyncio.run: the engine image still
+        # runs python 3.6.
+        results = asyncio.get_event_loop().run_until_complete(create_all())
+        accounts = [account for account in results if account]
         self.logger.info(accounts)
 
     def generate_testbed_conf(self):
@@ -114,11 +119,13 @@ class NetworkPlanner(object):
 
     def generate_enodes(self):
         self.logger.info("===== ENODES GENERATION =====")
-        enodes = []
-        for client in self.clients:
-            enode = client.generate_enode()
-            if enode:
-                enodes.append(enode)
+
+        # enode generations are independent across nodes as well.
+        async def create_all():
+            return await asyncio.gather(*[client.generate_enode() for client in self.clients])
+
+        results = asyncio.get_event_loop().run_until_complete(create_all())
+        enodes = [enode for enode in results if enode]
         self.logger.info(enodes)
 
     def generate_genesis(self):
@@ -163,24 +170,29 @@ class NetworkPlanner(object):
 
         # Default balance
         starting_balance = "0x000000000000000000100000000000000000000000000000000000000000000"
-        genesis["alloc"] = {}
         genesis["config"]["autonity"]["operator"] = "0x{}".format(self.clients[0].coin_base)
         genesis["config"]["autonity"]["treasury"] = "0x{}".format(self.clients[0].coin_base)
 
-        for index, client in enumerate(self.clients):
-            coinbase = "0x{}".format(client.coin_base)
-            validator = {
-                "treasury": coinbase,
+        # build the allocation and validator views in one pass each instead of
+        # appending through the nested genesis lookups per client.
+        genesis["alloc"] = {
+            "0x{}".format(client.coin_base): {"balance": starting_balance} for client in self.clients
+        }
+        genesis["config"]["autonity"]["validators"] = [
+            {
+                "treasury": "0x{}".format(client.coin_base),
                 "enode": client.e_node,
-                "bondedStake": 10000  if client.role  == "validator" else 5000,
-                "oracleAddress": coinbase,
+                "bondedStake": 10000 if client.role == "validator" else 5000,
+                "oracleAddress": "0x{}".format(client.coin_base),
                 "consensusKey": client.consensus_pub_key,
             }
-            genesis["alloc"][coinbase] = {"balance": starting_balance}
-            genesis["config"]["autonity"]["validators"].append(validator)
+            for client in self.clients
+        ]
 
-        with open("./network-data/genesis.json", 'w') as out:
-            out.write(json.dumps(genesis, indent=4) + '\n')
+        # orjson serializes the whole document in one C-level pass and emits
+        # bytes directly, so write those as-is.
+        data = orjson.dumps(genesis, option=orjson.OPT_INDENT_2)
+        pathlib.Path("./network-data/genesis.json").write_bytes(data + b'\n')
 
     def generate_systemd_service_file(self):
         self.logger.info("===== SYSTEMD SERVICE FILE GENERATION =====")
@@ -189,6 +201,9 @@ class NetworkPlanner(object):
 
     def generate_package(self):
         self.logger.info("===== PACKAGE GENERATION =====")
+        # the packaged binary is the same for every node, copy it once here
+        # instead of once per client.
+        utility.execute(["cp", self.autonity_path, "./network-data/"])
         for client in self.clients:
             client.generate_package()
 
@@ -4,7 +4,6 @@ import log
 import sched
 import threading
 import time
-import copy
 
 
 class Scheduler(object):
@@ -196,32 +195,32 @@ class Scheduler(object):
                 return True
 
             if step["action"] == "connect":
-                peers = copy.deepcopy(step["peers"])
+                peers = list(step["peers"])
                 self.scheduler.enter(step["delay"], 1, self.connect_peers, argument=(1, peers))
                 return True
 
             if step["action"] == "disconnect":
-                peers = copy.deepcopy(step["peers"])
+                peers = list(step["peers"])
                 self.scheduler.enter(step["delay"], 1, self.dis_connect_peers, argument=(1, peers))
                 return True
 
             if step["action"] == "stop":
-                target = copy.deepcopy(step["target"])
+                target = list(step["target"])
                 self.scheduler.enter(step["delay"], 1, self.stop_clients, argument=(1, target))
                 return True
 
             if step["action"] == "start":
-                target = copy.deepcopy(step["target"])
+                target = list(step["target"])
                 self.scheduler.enter(step["delay"], 1, self.start_clients, argument=(1, target))
                 return True
 
             if step["action"] == "delay":
-                step_copy = copy.deepcopy(step)
+                step_copy = dict(step)
                 self.scheduler.enter(step["delay"], 1, self.set_delays, argument=(1, step_copy))
                 return True
 
             if step["action"] == "un-delay":
-                step_copy = copy.deepcopy(step)
+                step_copy = dict(step)
                 self.scheduler.enter(step["delay"], 1, self.clear_delays, argument=(1, step_copy))
                 return True
 
@@ -44,8 +44,8 @@ def init():
 
 def is_docker_installed():
     try:
-        result = utility.execute("docker --version")
-        if result[1] == "":
+        result = utility.execute(["docker", "--version"], capture=True)
+        if result.stderr == "":
             return True
     except Exception as e:
         print("checking docker failed: ", e)
@@ -56,22 +56,20 @@ def is_docker_installed():
 
 def install_docker():
     try:
-        utility.execute("sudo apt-get update")
-        utility.execute("sudo apt-get install --yes docker.io")
+        utility.execute(["sudo", "apt-get", "update"])
+        utility.execute(["sudo", "apt-get", "install", "--yes", "docker.io"])
         print("docker is been installed.")
     except Exception as e:
         print("cannot install docker: ", e)
 
 
 def check_docker_daemon():
-    result = ("", "")
     try:
-        result = utility.execute("pidof dockerd")
+        # pidof exits non-zero when dockerd is not running.
+        utility.execute(["pidof", "dockerd"], capture=True)
     except Exception as e:
         print("unknown state of dockerd. ", e)
-        utility.execute("sudo service docker start")
-    if result[0] == "" and result[1] == "":
-        utility.execute("sudo service docker start")
+        utility.execute(["sudo", "service", "docker", "start"], check=False)
         print("docker daemon is started by this script.")
 
 
@@ -114,13 +112,15 @@ def create_test_bed(job_id):
                                               volumes={"/sys/fs/cgroup": {"bind": "/sys/fs/cgroup", "mode": "ro"}})
             print("create new container: ", container.id)
             container.logs()
-            result = utility.execute("sudo docker inspect -f \'{{range .NetworkSettings.Networks}}{{.IPAddress}}{{end}}\' " + node_name)
-            if result[1] != "":
-                print("cannot get container ip: ", result[1])
+            result = utility.execute(["sudo", "docker", "inspect", "-f",
+                                      "{{range .NetworkSettings.Networks}}{{.IPAddress}}{{end}}", node_name],
+                                     capture=True, check=False)
+            if result.returncode != 0 or result.stderr != "":
+                print("cannot get container ip: ", result.stderr)
                 continue
 
-            print("get container ip: ", result[0])
-            for part in result[0].split():
+            print("get container ip: ", result.stdout)
+            for part in result.stdout.split():
                 try:
                     a = ipaddress.ip_network(part)
                 except ValueError:
@@ -285,9 +285,9 @@ if __name__ == "__main__":
         #    volumes={autonity_path: {"bind": "/autonity", "mode": "rw"}})
 
         # copy binary to binary dir for image building.
-        utility.execute("cp {} ./test_bin/".format(autonity_bin))
-        utility.execute("cp {} ./test_bin/".format(bootnode_bin))
-        utility.execute("cp {} ./test_bin/".format(key_inspector_bin))
+        utility.execute(["cp", autonity_bin, "./test_bin/"])
+        utility.execute(["cp", bootnode_bin, "./test_bin/"])
+        utility.execute(["cp", key_inspector_bin, "./test_bin/"])
 
         # build autonity client image.
         check_to_build_client_images()
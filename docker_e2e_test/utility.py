@@ -1,23 +1,48 @@
+import asyncio
+import os
+import shlex
+import shutil
 import subprocess
 
 
-def execute(cmd):
-    print("[CMD] {}".format(cmd))
-    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding="utf-8", shell=True)
-    return process.communicate(input='\n')
+def _format_cmd(argv):
+    # shlex.join needs python 3.8, the engine image still runs 3.6.
+    return " ".join(shlex.quote(arg) for arg in argv)
+
+
+def execute(argv, capture=False, check=True):
+    print("[CMD] {}".format(_format_cmd(argv)))
+    # only pay for pipes when the caller actually parses the output, and fail
+    # loudly on a non-zero exit instead of carrying on against broken state.
+    out = subprocess.PIPE if capture else subprocess.DEVNULL
+    return subprocess.run(argv, stdout=out, stderr=out, encoding="utf-8", input='\n', check=check)
+
+
+async def execute_async(argv, capture=False):
+    print("[CMD] {}".format(_format_cmd(argv)))
+    out = asyncio.subprocess.PIPE if capture else asyncio.subprocess.DEVNULL
+    process = await asyncio.create_subprocess_exec(
+        *argv, stdin=asyncio.subprocess.PIPE, stdout=out, stderr=out)
+    stdout, stderr = await process.communicate(input=b'\n')
+    # mirror the check=True behaviour of execute(): a failed node setup step
+    # must abort the deployment instead of leaving broken state behind.
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, argv, stdout, stderr)
+    if not capture:
+        return None, None
+    return stdout.decode("utf-8"), stderr.decode("utf-8")
 
 
 def create_dir(dir_name):
-    execute("mkdir -p {}".format(dir_name))
+    os.makedirs(dir_name, exist_ok=True)
 
 
 def remove_dir(dir_name):
-    execute("rm -rf {}".format(dir_name))
+    shutil.rmtree(dir_name, ignore_errors=True)
 
 
 def create_network_dir(ip_list):
     remove_dir("./network-data")
-    create_dir("./network-data")
     for ip in ip_list:
         create_dir("./network-data/{}".format(ip))
 
@@ -43,21 +68,16 @@ def extract_keys(output_string):
 
     return keys
 
-def gen_autonity_keys(autonity, key_inspector, key_file):
+async def gen_autonity_keys(autonity, key_inspector, key_file):
     # Generate a node-specific key file using autonity command
-    autonity_command = f"{autonity} genAutonityKeys {key_file}"
-    subprocess.run(autonity_command, shell=True)
+    await execute_async([autonity, "genAutonityKeys", key_file])
 
     # Inspect the generated key file using key_inspector command with -private flag
-    key_inspector_command = f"{key_inspector} autinspect {key_file} -private"
-    process = subprocess.Popen(key_inspector_command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    output, error = process.communicate()
+    output_string, error = await execute_async([key_inspector, "autinspect", key_file, "-private"], capture=True)
 
     if error:
         return None  # Return None if there was an error
 
-    output_string = output.decode("utf-8")
-
     # Extract and return the keys as separate parameters
     keys = extract_keys(output_string)
     return keys.get("Node Address"), keys.get("Node Public Key"), keys.get("Consensus Public Key"), keys.get("Consensus Private Key"), keys.get("Node Private Key")